@@ -0,0 +1,84 @@
+"""
+JSON encoding/decoding, used for both requests & responses.
+
+If `orjson` is installed (`pip install django-microapi[fast]`), it's used for
+both encoding & decoding. Otherwise, this falls back to the standard library's
+`json` module.
+
+Either way, anything that can't be natively encoded (including datetimes,
+dates & times) is handed to Django's `DjangoJSONEncoder`, so the output matches
+what `JsonResponse` would produce, regardless of which backend is used.
+
+`orjson` also only encodes integers that fit in 64 bits. Data with larger
+integers is encoded via the standard library instead, so both backends accept
+the same data.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+# Used to distinguish "not yet decoded" from any decoded JSON value, when
+# caching decoded bodies.
+_MISSING = object()
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def _default(obj):
+    # Called by `orjson` for anything it doesn't handle itself (like
+    # `Decimal` or lazy translation strings), as well as datetimes/times.
+    return _django_encoder.default(obj)
+
+
+def dumps(data):
+    """
+    Encodes data as JSON.
+
+    Args:
+        data (dict|list): The data to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+
+    Raises:
+        TypeError: If the data contains something that can't be encoded.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=_default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+            )
+        except orjson.JSONEncodeError:
+            # Most likely an integer outside of the 64-bit range, which the
+            # standard library can handle. If not, it'll raise a `TypeError`
+            # as well.
+            pass
+
+    return json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+def loads(body):
+    """
+    Decodes a JSON body.
+
+    Args:
+        body (bytes|str): The encoded JSON.
+
+    Returns:
+        dict|list: The decoded data.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+
+    return json.loads(body)
@@ -1,49 +1,148 @@
-from collections import OrderedDict
+import keyword
+from functools import lru_cache
 
 from django.db.models.fields.related import RelatedField
 
 from .exceptions import InvalidFieldError
 
 
+@lru_cache(maxsize=None)
+def _collect_field_names_for_class(cls, sort_fields=True):
+    """
+    Collects the serializable field names for a Model class.
+
+    The result only depends on the class, so it's cached for the life of the
+    process, rather than being rebuilt for every instance serialized.
+
+    Args:
+        cls (Model): A Django Model class.
+        sort_fields (bool): (Optional) If `True`, the names are sorted
+            alphabetically. Otherwise, they're in the order the fields are
+            declared on the Model. Default is `True`.
+
+    Returns:
+        tuple: A tuple of all field names.
+    """
+    field_names = []
+
+    for field in cls._meta.fields:
+        # Exclude exceptional (Related, Generated, Virtual) fields.
+        if field.column is None or getattr(field, "generated", False):
+            continue
+
+        if isinstance(field, RelatedField):
+            continue
+
+        if field.attname not in field_names:
+            field_names.append(field.attname)
+
+    if sort_fields:
+        # Sort the field list in alphabetical order.
+        # While not strictly necessary, we're talking about a relatively small
+        # number of fields, and nicer readability for consumers.
+        field_names.sort()
+
+    return tuple(field_names)
+
+
+@lru_cache(maxsize=256)
+def _make_to_dict(names):
+    """
+    Generates a function specialized to turn a Model into a dict.
+
+    For instance, with names of `("id", "title")`, this builds the equivalent
+    of::
+
+        def to_dict(model):
+            return {"id": model.id, "title": model.title}
+
+    Unrolling the fields this way avoids a loop & a `getattr` per field.
+
+    Args:
+        names (tuple): The field names, in the desired order.
+
+    Returns:
+        callable: A function that takes a Model instance & returns a dict.
+    """
+    for name in names:
+        if not name.isidentifier() or keyword.iskeyword(name):
+            # Can't be used as a plain attribute access, so fall back to the
+            # general (slower) approach.
+            return lambda model: {
+                field_name: getattr(model, field_name) for field_name in names
+            }
+
+    items = ", ".join(f"{name!r}: model.{name}" for name in names)
+    source = f"def to_dict(model):\n    return {{{items}}}\n"
+
+    namespace = {}
+    exec(compile(source, "<microapi.serializers>", "exec"), namespace)
+    return namespace["to_dict"]
+
+
+# Caches the field names, specialized `to_dict` function & a set of the field
+# names (for fast membership checks), keyed by `(serializer class, Model class,
+# sort_fields)`. Keying on the serializer class means subclasses that override
+# `collect_field_names` get their own entries.
+_FIELD_CACHE = {}
+
+
 class ModelSerializer:
     """
     A stupid-simple object to handle serializing/deserializing Model data.
 
     If you have even the slightest of complex needs, you're better off handling
     serialization manually.
+
+    Args:
+        sort_fields (bool): (Optional) If `True`, fields are serialized in
+            alphabetical order. If `False`, they're left in the order they're
+            declared on the Model, which skips the sorting work. Default is
+            `True`.
     """
 
+    # No per-instance `__dict__` needed, keeping instances small.
+    __slots__ = ("sort_fields",)
+
+    def __init__(self, sort_fields=True):
+        self.sort_fields = sort_fields
+
     def collect_field_names(self, model):
         """
-        Given a Model instance, collects all the field names from it.
+        Given a Model instance (or class), collects all the field names from it.
 
         This includes any parent fields. It excludes:
         * Related fields
         * Generated fields
         * Virtual fields
 
+        The lookup is cached per Model class.
+
         Args:
-            model (Model): A Django Model instance (not the class).
+            model (Model): A Django Model instance or class.
 
         Returns:
-            list: A sorted list of all field names.
+            list: A list of all field names (sorted, unless `sort_fields` is
+                `False`).
         """
-        field_names = set()
+        if not isinstance(model, type):
+            model = type(model)
 
-        for field in model._meta.fields:
-            # Exclude exceptional (Related, Generated, Virtual) fields.
-            if field.column is None or getattr(field, "generated", False):
-                continue
+        return list(_collect_field_names_for_class(model, self.sort_fields))
 
-            if isinstance(field, RelatedField):
-                continue
+    def _field_spec(self, cls):
+        # Looks up (or builds & caches) the `(field_names, to_dict, field_set)`
+        # for a Model class, so `collect_field_names` only runs once per class.
+        key = (type(self), cls, self.sort_fields)
 
-            field_names.add(field.attname)
+        try:
+            return _FIELD_CACHE[key]
+        except KeyError:
+            pass
 
-        # Sort the field list in alphabetical order.
-        # While not strictly necessary, we're talking about a relatively small
-        # number of fields, and nicer readability for consumers.
-        return sorted(field_names)
+        names = tuple(self.collect_field_names(cls))
+        spec = _FIELD_CACHE[key] = (names, _make_to_dict(names), frozenset(names))
+        return spec
 
     def to_dict(self, model, exclude=None):
         """
@@ -51,25 +150,60 @@ class ModelSerializer:
 
         Args:
             model (Model): A populated Model instance.
-            exclude (list): A list of fields to exclude from the final dict.
-                Default is `[]`.
+            exclude (iterable): The fields to exclude from the final dict.
+                Default is `None` (nothing excluded).
 
         Returns:
-            OrderedDict: A dictionary of the field names/values.
+            dict: A dictionary of the field names/values.
         """
-        if exclude is None:
-            exclude = []
+        names, to_dict, _ = self._field_spec(type(model))
+
+        if exclude:
+            # Don't even fetch excluded fields (they may be deferred).
+            exclude = frozenset(exclude)
+            to_dict = _make_to_dict(
+                tuple(name for name in names if name not in exclude)
+            )
+
+        # Plain dicts preserve insertion order, so the field order
+        # carries through when it's time to serialize the JSON.
+        return to_dict(model)
+
+    def to_dict_many(self, models, exclude=None):
+        """
+        Converts many populated Models into a list of plain dictionaries.
+
+        Equivalent to calling `to_dict` on each Model, but the field names
+        (minus any excludes) are only worked out once per Model class, rather
+        than once per instance.
+
+        Args:
+            models (iterable): The populated Model instances.
+            exclude (iterable): The fields to exclude from the final dicts.
+                Default is `None` (nothing excluded).
+
+        Returns:
+            list: A list of dictionaries of the field names/values.
+        """
+        exclude = frozenset(exclude or ())
+        converters = {}
+        data = []
+
+        for model in models:
+            cls = type(model)
+            to_dict = converters.get(cls)
+
+            if to_dict is None:
+                names, to_dict, _ = self._field_spec(cls)
 
-        # Use an ordered dict, as it'll preserve the sorted field order when
-        # it's time to serialize the JSON.
-        data = OrderedDict()
-        field_list = self.collect_field_names(model)
+                if exclude:
+                    to_dict = _make_to_dict(
+                        tuple(name for name in names if name not in exclude)
+                    )
 
-        for field_name in field_list:
-            data[field_name] = getattr(model, field_name)
+                converters[cls] = to_dict
 
-        for exclude_name in exclude:
-            data.pop(exclude_name, None)
+            data.append(to_dict(model))
 
         return data
 
@@ -90,10 +224,12 @@ class ModelSerializer:
         Returns:
             Model: The populated (but unsaved) model instance.
         """
-        field_list = self.collect_field_names(model)
+        # Only the provided keys are walked (not every field on the Model), &
+        # the set of valid names is cached per Model class.
+        field_set = self._field_spec(type(model))[2]
 
         for key, value in data.items():
-            if strict and key not in field_list:
+            if strict and key not in field_set:
                 raise InvalidFieldError(
                     f"{key} not found on {model.__class__.__name__}"
                 )
@@ -1,5 +1,3 @@
-import json
-
 from django.test import (
     RequestFactory,
     TestCase,
@@ -7,6 +5,30 @@ from django.test import (
 from django.test.client import MULTIPART_CONTENT
 
 from . import http
+from .encoding import (
+    _MISSING,
+    loads,
+)
+
+
+# The headers used by `create_request` if none are provided. Copied on use, so
+# that requests can't modify the shared defaults.
+_DEFAULT_JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accepts": "application/json",
+}
+
+# Maps the (lowercased) HTTP method to the `RequestFactory` method name.
+# `PATCH` is intentionally absent, as it's handled separately below.
+_METHOD_DISPATCH = {
+    "get": "get",
+    "post": "post",
+    "put": "put",
+    "delete": "delete",
+    "head": "head",
+    "options": "options",
+    "trace": "trace",
+}
 
 
 # Some assert methods, useful for `pytest` or similar.
@@ -32,134 +54,75 @@ def assert_status_code(resp, status_code):
         raise AssertionError(f"{resp.status_code} != {status_code}")
 
 
-def assert_ok(resp):
-    """
-    Checks the response for an `HTTP 200 OK`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `200`.
-    """
-    assert_status_code(resp, status_code=http.OK)
-
-
-def assert_created(resp):
-    """
-    Checks the response for an `HTTP 201 Created`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `201`.
-    """
-    assert_status_code(resp, status_code=http.CREATED)
-
-
-def assert_accepted(resp):
+def _make_status_assertion(name, status_code, description):
     """
-    Checks the response for an `HTTP 202 Accepted`.
+    Builds an assertion function that checks for a specific status code.
 
     Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `202`.
-    """
-    assert_status_code(resp, status_code=http.ACCEPTED)
-
-
-def assert_no_content(resp):
-    """
-    Checks the response for an `HTTP 204 No Content`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `204`.
-    """
-    assert_status_code(resp, status_code=http.NO_CONTENT)
-
-
-def assert_bad_request(resp):
-    """
-    Checks the response for an `HTTP 400 Bad Request`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `400`.
-    """
-    assert_status_code(resp, status_code=http.BAD_REQUEST)
-
-
-def assert_unauthorized(resp):
-    """
-    Checks the response for an `HTTP 401 Unauthorized`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `401`.
-    """
-    assert_status_code(resp, status_code=http.UNAUTHORIZED)
-
-
-def assert_forbidden(resp):
-    """
-    Checks the response for an `HTTP 403 Forbidden`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
-
-    Raises:
-        AssertionError: If the response's status code is not a `403`.
-    """
-    assert_status_code(resp, status_code=http.FORBIDDEN)
-
-
-def assert_not_found(resp):
-    """
-    Checks the response for an `HTTP 404 Not Found`.
-
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
+        name (str): The name of the function.
+        status_code (int): The desired HTTP status code.
+        description (str): The human-readable status (e.g. `Not Found`).
 
-    Raises:
-        AssertionError: If the response's status code is not a `404`.
+    Returns:
+        callable: The assertion function, which takes a response.
     """
-    assert_status_code(resp, status_code=http.NOT_FOUND)
 
+    def assertion(resp):
+        assert_status_code(resp, status_code)
 
-def assert_not_allowed(resp):
-    """
-    Checks the response for an `HTTP 405 Not Allowed`.
+    assertion.__name__ = name
+    assertion.__qualname__ = name
+    assertion.__doc__ = f"""
+    Checks the response for an `HTTP {status_code} {description}`.
 
     Args:
         resp (django.http.HttpResponse): The response from the view.
 
     Raises:
-        AssertionError: If the response's status code is not a `405`.
+        AssertionError: If the response's status code is not a `{status_code}`.
     """
-    assert_status_code(resp, status_code=http.NOT_ALLOWED)
-
+    return assertion
 
-def assert_app_error(resp):
-    """
-    Checks the response for an `HTTP 500 Application Error`.
 
-    Args:
-        resp (django.http.HttpResponse): The response from the view.
+# The specialized status code assertions.
+assert_ok = _make_status_assertion("assert_ok", http.OK, "OK")
+assert_created = _make_status_assertion("assert_created", http.CREATED, "Created")
+assert_accepted = _make_status_assertion("assert_accepted", http.ACCEPTED, "Accepted")
+assert_no_content = _make_status_assertion(
+    "assert_no_content", http.NO_CONTENT, "No Content"
+)
+assert_bad_request = _make_status_assertion(
+    "assert_bad_request", http.BAD_REQUEST, "Bad Request"
+)
+assert_unauthorized = _make_status_assertion(
+    "assert_unauthorized", http.UNAUTHORIZED, "Unauthorized"
+)
+assert_forbidden = _make_status_assertion(
+    "assert_forbidden", http.FORBIDDEN, "Forbidden"
+)
+assert_not_found = _make_status_assertion(
+    "assert_not_found", http.NOT_FOUND, "Not Found"
+)
+assert_not_allowed = _make_status_assertion(
+    "assert_not_allowed", http.NOT_ALLOWED, "Not Allowed"
+)
+assert_app_error = _make_status_assertion(
+    "assert_app_error", http.APP_ERROR, "Application Error"
+)
 
-    Raises:
-        AssertionError: If the response's status code is not a `500`.
-    """
-    assert_status_code(resp, status_code=http.APP_ERROR)
+# Maps the `ApiTestCase` method names to the status code assertions.
+_STATUS_ASSERTIONS = {
+    "assertOK": assert_ok,
+    "assertCreated": assert_created,
+    "assertAccepted": assert_accepted,
+    "assertNoContent": assert_no_content,
+    "assertBadRequest": assert_bad_request,
+    "assertUnauthorized": assert_unauthorized,
+    "assertForbidden": assert_forbidden,
+    "assertNotFound": assert_not_found,
+    "assertNotAllowed": assert_not_allowed,
+    "assertAppError": assert_app_error,
+}
 
 
 def check_response(resp):
@@ -170,7 +133,8 @@ def check_response(resp):
     * A valid `Content-Type` header
     * Loads the JSON body
 
-    If no body is present, this returns an empty `dict`.
+    If no body is present, this returns an empty `dict`. The decoded data is
+    cached on the response, so checking the same response repeatedly is cheap.
 
     Args:
         resp (django.http.HttpResponse): The response from the view.
@@ -185,12 +149,20 @@ def check_response(resp):
     """
     assert "application/json" in resp.headers.get("Content-Type", "")
 
+    data = getattr(resp, "_microapi_json", _MISSING)
+
+    if data is not _MISSING:
+        return data
+
     body_data = resp.content
 
     if len(body_data):
-        return json.loads(body_data)
+        data = loads(body_data)
+    else:
+        data = {}
 
-    return {}
+    resp._microapi_json = data
+    return data
 
 
 def create_request(url, method="GET", headers=None, data=None, user=None, factory=None):
@@ -209,32 +181,25 @@ def create_request(url, method="GET", headers=None, data=None, user=None, factor
 
     Returns:
         Request: The built request object.
+
+    Raises:
+        ValueError: If the HTTP method is `PATCH` or otherwise unsupported.
     """
     if headers is None:
-        headers = {
-            "Content-Type": "application/json",
-            "Accepts": "application/json",
-        }
+        headers = _DEFAULT_JSON_HEADERS.copy()
 
     if factory is None:
         factory = RequestFactory()
 
-    if method.lower() == "get":
-        req_method = factory.get
-    elif method.lower() == "post":
-        req_method = factory.post
-    elif method.lower() == "put":
-        req_method = factory.put
-    elif method.lower() == "delete":
-        req_method = factory.delete
-    elif method.lower() == "patch":
+    method_lower = method.lower()
+
+    if method_lower == "patch":
         raise ValueError("Django's RequestFactory does not support PATCH.")
-    elif method.lower() == "head":
-        req_method = factory.head
-    elif method.lower() == "options":
-        req_method = factory.options
-    elif method.lower() == "trace":
-        req_method = factory.trace
+
+    try:
+        req_method = getattr(factory, _METHOD_DISPATCH[method_lower])
+    except KeyError:
+        raise ValueError(f"Unsupported HTTP method '{method}'.")
 
     req = req_method(
         url,
@@ -320,126 +285,6 @@ class ApiTestCase(TestCase):
         """
         assert_status_code(resp, status_code)
 
-    def assertOK(self, resp):
-        """
-        Checks the response for an `HTTP 200 OK`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `200`.
-        """
-        assert_ok(resp)
-
-    def assertCreated(self, resp):
-        """
-        Checks the response for an `HTTP 201 Created`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `201`.
-        """
-        assert_created(resp)
-
-    def assertAccepted(self, resp):
-        """
-        Checks the response for an `HTTP 202 Accepted`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `202`.
-        """
-        assert_accepted(resp)
-
-    def assertNoContent(self, resp):
-        """
-        Checks the response for an `HTTP 204 No Content`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `204`.
-        """
-        assert_no_content(resp)
-
-    def assertBadRequest(self, resp):
-        """
-        Checks the response for an `HTTP 400 Bad Request`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `400`.
-        """
-        assert_bad_request(resp)
-
-    def assertUnauthorized(self, resp):
-        """
-        Checks the response for an `HTTP 401 Unauthorized`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `401`.
-        """
-        assert_unauthorized(resp)
-
-    def assertForbidden(self, resp):
-        """
-        Checks the response for an `HTTP 403 Forbidden`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `403`.
-        """
-        assert_forbidden(resp)
-
-    def assertNotFound(self, resp):
-        """
-        Checks the response for an `HTTP 404 Not Found`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `404`.
-        """
-        assert_not_found(resp)
-
-    def assertNotAllowed(self, resp):
-        """
-        Checks the response for an `HTTP 405 Not Allowed`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `405`.
-        """
-        assert_not_allowed(resp)
-
-    def assertAppError(self, resp):
-        """
-        Checks the response for an `HTTP 500 Application Error`.
-
-        Args:
-            resp (django.http.HttpResponse): The response from the view.
-
-        Raises:
-            AssertionError: If the response's status code is not a `500`.
-        """
-        assert_app_error(resp)
-
     def assertResponseEquals(self, resp, data):
         """
         Checks for a valid response & asserts the response body matches the
@@ -460,3 +305,11 @@ class ApiTestCase(TestCase):
         """
         resp_data = check_response(resp)
         self.assertEqual(resp_data, data)
+
+
+# Attach the status code assertions (`assertOK`, `assertCreated`, etc.) to
+# `ApiTestCase`. As `staticmethod`s, they don't add an extra call per check.
+for _method_name, _assertion in _STATUS_ASSERTIONS.items():
+    setattr(ApiTestCase, _method_name, staticmethod(_assertion))
+
+del _method_name, _assertion
@@ -1,6 +1,8 @@
-import json
-
-from django.http import JsonResponse
+from django.db.models import QuerySet
+from django.http import (
+    HttpResponse,
+    StreamingHttpResponse,
+)
 from django.utils.decorators import classonlymethod
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic.base import View
@@ -11,9 +13,28 @@ from .exceptions import (
     # DataValidationError,
 )
 from . import http
+from .encoding import (
+    _MISSING,
+    dumps,
+    loads,
+)
 from .serializers import ModelSerializer
 
 
+# The `Content-Type` values accepted by `ApiView.read_json` in strict mode.
+_VALID_JSON_CONTENT_TYPES = frozenset(
+    [
+        "application/json",
+    ]
+)
+
+# The `Content-Type` of every response we render.
+_JSON_CONTENT_TYPE = "application/json"
+
+# How many rows `ApiView.render_iter` fetches from the database at a time.
+_ITERATOR_CHUNK_SIZE = 2000
+
+
 class ApiView(View):
     """
     Just a bit of sugar on top of plain ol' `View`.
@@ -99,18 +120,23 @@ class ApiView(View):
         Returns:
             HttpResponse: Typically, a JSON-encoded response.
         """
+        if self.bubble_exceptions:
+            # No need to catch anything, if we're just going to re-raise it.
+            return super().dispatch(request, *args, **kwargs)
+
         try:
             return super().dispatch(request, *args, **kwargs)
         except Exception as err:
-            if self.bubble_exceptions:
-                raise
-
             return self.render_error(str(err))
 
     def read_json(self, request, strict=True):
         """
         Reads the request body & returns the decoded JSON.
 
+        If the body is empty, this returns an empty `dict`. The decoded data is
+        cached on the request, so calling this repeatedly is cheap (but note
+        that the same object is returned each time).
+
         Args:
             request (HttpRequest): The received request
             strict (bool): (Optional) If provided, requires "correct" JSON
@@ -119,19 +145,32 @@ class ApiView(View):
         Returns:
             dict: The decoded JSON body
         """
-        valid_content_types = [
-            "application/json",
-        ]
-
         if strict:
-            # Check the Content-Type.
-            if request.headers.get("Content-type", "") not in valid_content_types:
+            # Check the Content-Type, ignoring any parameters (like `charset`).
+            content_type = request.headers.get("Content-Type", "")
+            content_type = content_type.split(";", 1)[0].strip()
+
+            if content_type not in _VALID_JSON_CONTENT_TYPES:
                 raise ApiError("Invalid Content-type provided.")
 
-        try:
-            return json.loads(request.body)
-        except ValueError:
-            raise ApiError("Invalid JSON payload provided.")
+        # Only decode the body once per request.
+        data = getattr(request, "_microapi_json", _MISSING)
+
+        if data is not _MISSING:
+            return data
+
+        body = request.body
+
+        if not body:
+            data = {}
+        else:
+            try:
+                data = loads(body)
+            except ValueError:
+                raise ApiError("Invalid JSON payload provided.")
+
+        request._microapi_json = data
+        return data
 
     def render(self, data, status_code=http.OK):
         """
@@ -143,9 +182,60 @@ class ApiView(View):
                 `http.OK` (a.k.a. `200`).
 
         Returns:
-            JsonResponse: The response for Django to provide to the user
+            HttpResponse: The response for Django to provide to the user
         """
-        return JsonResponse(data, status=status_code)
+        return HttpResponse(
+            dumps(data),
+            status=status_code,
+            content_type=_JSON_CONTENT_TYPE,
+        )
+
+    def render_iter(self, objs, key="results", status_code=http.OK):
+        """
+        Creates a streaming JSON response from many objects.
+
+        Each object is run through `serialize` & encoded one at a time as the
+        response is sent, rather than building the whole list (& then the whole
+        JSON body) in memory. Useful for very large lists.
+
+        The body looks like `{"success": true, "<key>": [...]}`.
+
+        Note that, because the response has already started, exceptions raised
+        during serialization can't be turned into an error response.
+
+        Args:
+            objs (iterable): An iterable of the objects to serialize. An
+                unevaluated `QuerySet` is iterated without caching its results.
+            key (str): The key the list of objects is placed under. Default is
+                `results`.
+            status_code (int): The desired HTTP status code. Default is
+                `http.OK` (a.k.a. `200`).
+
+        Returns:
+            StreamingHttpResponse: The response for Django to provide to the
+                user
+        """
+        if isinstance(objs, QuerySet) and objs._result_cache is None:
+            # An explicit `chunk_size` is required when `prefetch_related` is
+            # used.
+            objs = objs.iterator(chunk_size=_ITERATOR_CHUNK_SIZE)
+
+        def stream():
+            yield b'{"success":true,' + dumps(key) + b":["
+
+            for offset, obj in enumerate(objs):
+                if offset:
+                    yield b","
+
+                yield dumps(self.serialize(obj))
+
+            yield b"]}"
+
+        return StreamingHttpResponse(
+            stream(),
+            status=status_code,
+            content_type=_JSON_CONTENT_TYPE,
+        )
 
     def render_error(self, msgs, status_code=http.APP_ERROR):
         """
@@ -159,7 +249,7 @@ class ApiView(View):
                 `http.APP_ERROR` (a.k.a. `500`).
 
         Returns:
-            JsonResponse: The error response for Django to provide to the user
+            HttpResponse: The error response for Django to provide to the user
         """
         if not isinstance(msgs, (list, tuple)):
             # In case of a single string.
@@ -214,15 +304,35 @@ class ApiView(View):
         """
         Like `serialize`, but handles serialization for many objects.
 
+        Unless `serialize` or the serializer's `to_dict` have been customized,
+        this hands the objects to the serializer in bulk (`to_dict_many`).
+
+        Additionally, if an unevaluated `QuerySet` is provided (& `to_dict_many`
+        hasn't been customized either), the data is pulled directly from the
+        database via `QuerySet.values`, skipping building `Model` instances.
+        Note that this means any model-level hooks (a custom `Model.from_db`,
+        `__init__` or `post_init` signal handlers) are **NOT** run.
+
         Args:
             objs (iterable): An iterable of the objects to serialize.
 
         Returns:
             list: A list of serialized objects
         """
-        data = []
-
-        for obj in objs:
-            data.append(self.serialize(obj))
-
-        return data
+        serializer_cls = type(self.serializer)
+
+        if (
+            type(self).serialize is ApiView.serialize
+            and serializer_cls.to_dict is ModelSerializer.to_dict
+        ):
+            if (
+                isinstance(objs, QuerySet)
+                and objs._result_cache is None
+                and serializer_cls.to_dict_many is ModelSerializer.to_dict_many
+            ):
+                field_names = self.serializer.collect_field_names(objs.model)
+                return list(objs.values(*field_names))
+
+            return self.serializer.to_dict_many(objs)
+
+        return [self.serialize(obj) for obj in objs]
@@ -101,6 +101,13 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Hashing passwords properly is (intentionally) slow, which is wasted time when
+# creating test users. Do NOT use this outside of tests!
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-15 18:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('test_microapi', '0002_alter_blogpost_published_on_alter_blogpost_slug'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='updated_on',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -17,6 +17,7 @@ class BlogPost(models.Model):
         on_delete=models.CASCADE,
     )
     published_on = models.DateTimeField(default=timezone.now, db_index=True)
+    updated_on = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return f"{self.title}"
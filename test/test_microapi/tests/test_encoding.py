@@ -0,0 +1,64 @@
+import datetime
+import decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from microapi import encoding
+
+
+class EncodingTestCase(SimpleTestCase):
+    def test_dumps(self):
+        data = encoding.dumps({"success": True, "posts": [1, 2]})
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(encoding.loads(data), {"success": True, "posts": [1, 2]})
+
+    def test_dumps_django_types(self):
+        data = encoding.loads(
+            encoding.dumps(
+                {
+                    "price": decimal.Decimal("12.50"),
+                    "duration": datetime.timedelta(days=1, hours=2),
+                }
+            )
+        )
+        self.assertEqual(data["price"], "12.50")
+        self.assertEqual(data["duration"], "P1DT02H00M00S")
+
+    def test_dumps_datetimes(self):
+        data = encoding.loads(
+            encoding.dumps(
+                {
+                    "published_on": datetime.datetime(
+                        2023, 11, 28, 9, 26, 54, 123456, tzinfo=datetime.timezone.utc
+                    ),
+                    "day": datetime.date(2023, 11, 28),
+                    "time": datetime.time(1, 2, 3, 456789),
+                }
+            )
+        )
+        # Matches `DjangoJSONEncoder`, no matter the backend.
+        self.assertEqual(data["published_on"], "2023-11-28T09:26:54.123Z")
+        self.assertEqual(data["day"], "2023-11-28")
+        self.assertEqual(data["time"], "01:02:03.456")
+
+    def test_dumps_big_int(self):
+        data = encoding.loads(encoding.dumps({"big": 2**70}))
+        self.assertEqual(data, {"big": 2**70})
+
+    def test_dumps_unencodable(self):
+        with self.assertRaises(TypeError):
+            encoding.dumps({"nope": object()})
+
+    def test_loads(self):
+        self.assertEqual(encoding.loads(b'{"hello": "world"}'), {"hello": "world"})
+        self.assertEqual(encoding.loads('{"hello": "world"}'), {"hello": "world"})
+
+        with self.assertRaises(ValueError):
+            encoding.loads(b'{"hello": ')
+
+
+@mock.patch("microapi.encoding.orjson", None)
+class StdlibEncodingTestCase(EncodingTestCase):
+    # Runs all the same checks against the standard library fallback.
+    pass
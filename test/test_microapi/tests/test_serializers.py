@@ -24,7 +24,10 @@ class ModelSerializerTestCase(TestCase):
 
     def test_collect_field_names_post(self):
         names = self.serializer.collect_field_names(BlogPost)
-        self.assertEqual(names, ["content", "id", "published_on", "slug", "title"])
+        self.assertEqual(
+            names,
+            ["content", "id", "published_on", "slug", "title", "updated_on"],
+        )
 
     def test_collect_field_names_user(self):
         serializer = ModelSerializer()
@@ -46,6 +49,32 @@ class ModelSerializerTestCase(TestCase):
             ],
         )
 
+    def test_collect_field_names_unsorted(self):
+        serializer = ModelSerializer(sort_fields=False)
+        names = serializer.collect_field_names(BlogPost)
+        self.assertEqual(
+            names,
+            ["id", "title", "slug", "content", "published_on", "updated_on"],
+        )
+
+    def test_collect_field_names_override(self):
+        class NoContentSerializer(ModelSerializer):
+            def collect_field_names(self, model):
+                names = super().collect_field_names(model)
+                return [name for name in names if name != "content"]
+
+        post = BlogPost.objects.create(
+            title="Hello, World!",
+            content="My first post! *SURELY*, it won't be the last...",
+            published_by=self.user,
+        )
+
+        # The default serializer's (cached) fields shouldn't leak into the
+        # subclass, or vice versa.
+        self.assertIn("content", self.serializer.to_dict(post))
+        self.assertNotIn("content", NoContentSerializer().to_dict(post))
+        self.assertIn("content", self.serializer.to_dict(post))
+
     def test_to_dict(self):
         # Sanity check.
         self.assertEqual(BlogPost.objects.count(), 0)
@@ -64,7 +93,7 @@ class ModelSerializerTestCase(TestCase):
 
         self.assertEqual(
             [key for key in data],
-            ["content", "id", "published_on", "slug", "title"],
+            ["content", "id", "published_on", "slug", "title", "updated_on"],
         )
 
         # To prevent test failures due to whatever PK is assigned.
@@ -79,6 +108,29 @@ class ModelSerializerTestCase(TestCase):
         self.assertEqual(data["slug"], "hello-world")
         self.assertEqual(data["title"], "Hello, World!")
 
+    def test_to_dict_many(self):
+        post_1 = BlogPost.objects.create(
+            title="Hello, World!",
+            content="My first post! *SURELY*, it won't be the last...",
+            published_by=self.user,
+        )
+        post_2 = BlogPost.objects.create(
+            title="Life Update",
+            content="So, it's been awhile...",
+            published_by=self.user,
+        )
+
+        data = self.serializer.to_dict_many([post_1, post_2], exclude=["content"])
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(
+            [key for key in data[0]],
+            ["id", "published_on", "slug", "title", "updated_on"],
+        )
+        self.assertEqual(data[0]["slug"], "hello-world")
+        self.assertEqual(data[1]["slug"], "life-update")
+        self.assertEqual(data[1], self.serializer.to_dict(post_2, exclude=["content"]))
+
     def test_from_dict(self):
         post = BlogPost()
 
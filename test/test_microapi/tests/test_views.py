@@ -1,7 +1,17 @@
 import datetime
+import json
+from unittest import mock
 
-from django.utils.timezone import make_aware
+from django.core.cache import cache
+from django.utils.http import http_date
 
+from microapi import (
+    ApiError,
+    ApiView,
+    ModelSerializer,
+)
+from microapi import http
+from microapi import tests
 from microapi.tests import (
     ApiTestCase,
     check_response,
@@ -18,38 +28,62 @@ from ..views import (
 )
 
 
+POSTS_URL = "/api/v1/posts/"
+POST_DETAIL_URL = "/api/v1/posts/%d/"
+
+POST_1_PUBLISHED_ON = datetime.datetime(
+    2023, 11, 28, 9, 26, 54, 123456, tzinfo=datetime.timezone.utc
+)
+POST_2_PUBLISHED_ON = datetime.datetime(
+    2023, 12, 5, 10, 3, 22, 123456, tzinfo=datetime.timezone.utc
+)
+
+
 class BlogPostApiTestCase(ApiTestCase):
-    def setUp(self):
-        super().setUp()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             "testmctest",
             "teest@mctest.com",
             "testpass",
         )
-        self.post_1 = BlogPost.objects.create(
-            title="Hello, World!",
-            content="My first post! *SURELY*, it won't be the last...",
-            published_by=self.user,
-            published_on=make_aware(
-                datetime.datetime(2023, 11, 28, 9, 26, 54, 123456),
-                timezone=datetime.timezone.utc,
-            ),
-        )
-        self.post_2 = BlogPost.objects.create(
-            title="Life Update",
-            content="So, it's been awhile...",
-            published_by=self.user,
-            published_on=make_aware(
-                datetime.datetime(2023, 12, 5, 10, 3, 22, 123456),
-                timezone=datetime.timezone.utc,
-            ),
+        # `bulk_create` skips `BlogPost.save`, so the slugs are provided up
+        # front.
+        cls.post_1, cls.post_2 = BlogPost.objects.bulk_create(
+            [
+                BlogPost(
+                    title="Hello, World!",
+                    slug="hello-world",
+                    content="My first post! *SURELY*, it won't be the last...",
+                    published_by=cls.user,
+                    published_on=POST_1_PUBLISHED_ON,
+                ),
+                BlogPost(
+                    title="Life Update",
+                    slug="life-update",
+                    content="So, it's been awhile...",
+                    published_by=cls.user,
+                    published_on=POST_2_PUBLISHED_ON,
+                ),
+            ]
         )
 
+    def setUp(self):
+        super().setUp()
+        # `BlogPostDetailView` caches its responses, which would otherwise
+        # carry over between tests.
+        cache.clear()
+
     def test_posts_get_list(self):
         req = self.create_request(
-            "/api/v1/posts/",
+            POSTS_URL,
         )
-        resp = self.make_request(BlogPostListView, req)
+
+        # Guard against N+1 queries sneaking in. (One query for the ETag, one
+        # for the posts.)
+        with self.assertNumQueries(2):
+            resp = self.make_request(BlogPostListView, req)
+
         self.assertOK(resp)
 
         data = check_response(resp)
@@ -57,13 +91,90 @@ class BlogPostApiTestCase(ApiTestCase):
         self.assertTrue(len(data["posts"]), 2)
         self.assertEqual(data["posts"][0]["slug"], "life-update")
         self.assertEqual(data["posts"][1]["slug"], "hello-world")
+        self.assertEqual(
+            list(data["posts"][0].keys()),
+            ["id", "published_on", "slug", "title"],
+        )
+
+    def test_posts_get_list_not_modified(self):
+        req = self.create_request(
+            POSTS_URL,
+        )
+        resp = self.make_request(BlogPostListView, req)
+        self.assertOK(resp)
+
+        etag = resp.headers["ETag"]
+        headers = {
+            "Content-Type": "application/json",
+            "If-None-Match": etag,
+        }
+        req = self.create_request(POSTS_URL, headers=headers)
+
+        with self.assertNumQueries(1):
+            resp = self.make_request(BlogPostListView, req)
+
+        self.assertStatusCode(resp, http.NOT_MODIFIED)
+        self.assertEqual(resp.content, b"")
+        self.assertEqual(resp.headers["ETag"], etag)
+        self.assertNotIn("Content-Type", resp.headers)
+
+        # Changing a post should change the ETag.
+        self.post_2.title = "Life Update (Edited)"
+        self.post_2.save()
+
+        req = self.create_request(POSTS_URL, headers=headers)
+        resp = self.make_request(BlogPostListView, req)
+        self.assertOK(resp)
+        self.assertNotEqual(resp.headers["ETag"], etag)
+
+    def test_posts_get_list_not_modified_any(self):
+        req = self.create_request(
+            POSTS_URL,
+            headers={
+                "Content-Type": "application/json",
+                "If-None-Match": "*",
+            },
+        )
+        resp = self.make_request(BlogPostListView, req)
+        self.assertStatusCode(resp, http.NOT_MODIFIED)
+        self.assertIn("ETag", resp.headers)
+
+    def test_posts_get_list_deleted(self):
+        req = self.create_request(
+            POSTS_URL,
+        )
+        resp = self.make_request(BlogPostListView, req)
+        self.assertOK(resp)
+        # The latest update time can go backwards when a post is deleted, so
+        # it can't be used as a validator.
+        self.assertNotIn("Last-Modified", resp.headers)
+
+        self.post_2.delete()
+
+        headers = {
+            "Content-Type": "application/json",
+            "If-None-Match": resp.headers["ETag"],
+            "If-Modified-Since": http_date(),
+        }
+        req = self.create_request(POSTS_URL, headers=headers)
+        resp = self.make_request(BlogPostListView, req)
+        self.assertOK(resp)
+
+        data = check_response(resp)
+        self.assertEqual([post["slug"] for post in data["posts"]], ["hello-world"])
+
+        # Without an `ETag`, the date alone shouldn't give a `304`.
+        del headers["If-None-Match"]
+        req = self.create_request(POSTS_URL, headers=headers)
+        resp = self.make_request(BlogPostListView, req)
+        self.assertOK(resp)
 
     def test_posts_post_list(self):
         # Sanity check.
-        self.assertEqual(BlogPost.objects.count(), 2)
+        self.assertFalse(BlogPost.objects.filter(slug="cat-pictures").exists())
 
         req = self.create_request(
-            "/api/v1/posts/",
+            POSTS_URL,
             method="post",
             data={
                 "title": "Cat Pictures",
@@ -81,7 +192,6 @@ class BlogPostApiTestCase(ApiTestCase):
         self.assertTrue(data["post"]["slug"], "cat-pictures")
         self.assertTrue(data["post"]["content"], "All the internet is good for.")
 
-        self.assertEqual(BlogPost.objects.count(), 3)
         post = BlogPost.objects.get(slug="cat-pictures")
         self.assertEqual(post.published_by.pk, self.user.pk)
         self.assertEqual(post.published_on.year, 2023)
@@ -91,7 +201,7 @@ class BlogPostApiTestCase(ApiTestCase):
 
     def test_bubble_exceptions(self):
         req = self.create_request(
-            f"/api/v1/posts/",
+            POSTS_URL,
             method="delete",
             user=self.user,
         )
@@ -99,9 +209,36 @@ class BlogPostApiTestCase(ApiTestCase):
         with self.assertRaises(OhHellNoError):
             self.make_request(BlogPostListView, req)
 
+    def test_handled_exceptions(self):
+        class BrokenView(ApiView):
+            def get(self, request):
+                raise OhHellNoError("I don't think so.")
+
+        req = self.create_request(
+            POSTS_URL,
+        )
+        resp = self.make_request(BrokenView, req)
+        self.assertAppError(resp)
+        self.assertResponseEquals(
+            resp,
+            {
+                "success": False,
+                "errors": ["I don't think so."],
+            },
+        )
+
+        # A customized `render_error` should be used for those errors too.
+        class CustomErrorView(BrokenView):
+            def render_error(self, msgs, status_code=http.APP_ERROR):
+                return self.render({"custom": msgs}, status_code=http.BAD_REQUEST)
+
+        resp = self.make_request(CustomErrorView, req)
+        self.assertBadRequest(resp)
+        self.assertResponseEquals(resp, {"custom": "I don't think so."})
+
     def test_get_detail(self):
         req = self.create_request(
-            f"/api/v1/posts/{self.post_1.pk}/",
+            POST_DETAIL_URL % self.post_1.pk,
         )
         resp = self.make_request(BlogPostDetailView, req, post_id=self.post_1.pk)
         self.assertOK(resp)
@@ -110,9 +247,49 @@ class BlogPostApiTestCase(ApiTestCase):
         self.assertTrue(data["success"])
         self.assertEqual(data["post"]["slug"], "hello-world")
 
+    def test_get_detail_not_found(self):
+        req = self.create_request(
+            POST_DETAIL_URL % 999999,
+        )
+        resp = self.make_request(BlogPostDetailView, req, post_id=999999)
+        self.assertNotFound(resp)
+
+        data = check_response(resp)
+        self.assertFalse(data["success"])
+        self.assertEqual(data["errors"], ["Post does not exist"])
+
+    def test_get_detail_cached(self):
+        req = self.create_request(
+            POST_DETAIL_URL % self.post_1.pk,
+        )
+        first = self.make_request(BlogPostDetailView, req, post_id=self.post_1.pk)
+        self.assertOK(first)
+
+        # The second request should be served from the cache, without
+        # serializing the post again (or even loading it).
+        with mock.patch.object(BlogPostDetailView, "serialize") as serialize:
+            with self.assertNumQueries(1):
+                second = self.make_request(
+                    BlogPostDetailView, req, post_id=self.post_1.pk
+                )
+
+        serialize.assert_not_called()
+        self.assertOK(second)
+        self.assertEqual(second.content, first.content)
+
+        # Updating the post should skip past the stale cached body.
+        self.post_1.content = "Fixed a typo."
+        self.post_1.save()
+
+        third = self.make_request(BlogPostDetailView, req, post_id=self.post_1.pk)
+        self.assertOK(third)
+
+        data = check_response(third)
+        self.assertEqual(data["post"]["content"], "Fixed a typo.")
+
     def test_put_detail(self):
         req = self.create_request(
-            f"/api/v1/posts/{self.post_1.pk}/",
+            POST_DETAIL_URL % self.post_1.pk,
             method="put",
             data={
                 "content": "Fixed a typo.",
@@ -130,25 +307,23 @@ class BlogPostApiTestCase(ApiTestCase):
 
     def test_delete_detail(self):
         # Sanity check.
-        self.assertEqual(BlogPost.objects.count(), 2)
+        self.assertTrue(BlogPost.objects.filter(slug="hello-world").exists())
 
         req = self.create_request(
-            f"/api/v1/posts/{self.post_1.pk}/",
+            POST_DETAIL_URL % self.post_1.pk,
             method="delete",
             user=self.user,
         )
         resp = self.make_request(BlogPostDetailView, req, post_id=self.post_1.pk)
         self.assertNoContent(resp)
 
-        self.assertEqual(BlogPost.objects.count(), 1)
-
-        with self.assertRaises(BlogPost.DoesNotExist):
-            BlogPost.objects.get(slug="hello-world")
+        self.assertFalse(BlogPost.objects.filter(slug="hello-world").exists())
+        self.assertTrue(BlogPost.objects.filter(slug="life-update").exists())
 
     def test_no_patch_shortcuts(self):
         with self.assertRaises(ValueError) as err:
             self.create_request(
-                f"/api/v1/posts/{self.post_1.pk}/",
+                POST_DETAIL_URL % self.post_1.pk,
                 method="patch",
                 data={
                     "nope": "nopenope",
@@ -157,3 +332,191 @@ class BlogPostApiTestCase(ApiTestCase):
             )
 
             self.assertTrue("does not support PATCH" in str(err))
+
+    def test_status_assertions(self):
+        resp = ApiView().render({"success": True})
+        tests.assert_ok(resp)
+
+        with self.assertRaises(AssertionError) as err:
+            tests.assert_created(resp)
+
+        self.assertEqual(str(err.exception), "200 != 201")
+
+        with self.assertRaises(AssertionError):
+            self.assertNotFound(resp)
+
+        # The loop variables used to build these shouldn't leak out.
+        self.assertFalse(hasattr(tests, "_method_name"))
+
+    def test_unsupported_method(self):
+        with self.assertRaises(ValueError) as err:
+            self.create_request(
+                POSTS_URL,
+                method="BREW",
+            )
+
+        self.assertIn("Unsupported HTTP method 'BREW'", str(err.exception))
+
+    def test_render_iter(self):
+        view = ApiView()
+        resp = view.render_iter(
+            BlogPost.objects.all().order_by("-published_on"),
+            key="posts",
+        )
+        self.assertOK(resp)
+        self.assertTrue(resp.streaming)
+
+        data = json.loads(b"".join(resp.streaming_content))
+        self.assertTrue(data["success"])
+        self.assertEqual(len(data["posts"]), 2)
+        self.assertEqual(data["posts"][0]["slug"], "life-update")
+        self.assertEqual(data["posts"][1]["slug"], "hello-world")
+
+    def test_render_iter_prefetch(self):
+        view = ApiView()
+        resp = view.render_iter(User.objects.prefetch_related("blog_posts"))
+        self.assertOK(resp)
+
+        data = json.loads(b"".join(resp.streaming_content))
+        self.assertEqual(len(data["results"]), 1)
+        self.assertEqual(data["results"][0]["username"], "testmctest")
+
+    def test_render_iter_evaluated(self):
+        view = ApiView()
+        posts = BlogPost.objects.all().order_by("-published_on")
+        list(posts)
+
+        # An already-evaluated `QuerySet` shouldn't be fetched again.
+        with self.assertNumQueries(0):
+            resp = view.render_iter(posts, key="posts")
+            data = json.loads(b"".join(resp.streaming_content))
+
+        self.assertEqual(len(data["posts"]), 2)
+
+    def test_read_json_cached(self):
+        req = self.create_request(
+            POSTS_URL,
+            method="post",
+            data={
+                "title": "Cat Pictures",
+            },
+            user=self.user,
+        )
+        view = ApiView()
+
+        data = view.read_json(req)
+        self.assertEqual(data, {"title": "Cat Pictures"})
+        # The second read should hand back the already-decoded data.
+        self.assertIs(view.read_json(req), data)
+
+    def test_read_json_empty_body(self):
+        req = self.factory.generic(
+            "POST",
+            POSTS_URL,
+            b"",
+            # Django only sets the `Content-Type` for non-empty bodies.
+            CONTENT_TYPE="application/json",
+        )
+        view = ApiView()
+        self.assertEqual(view.read_json(req), {})
+
+    def test_read_json_content_type_params(self):
+        req = self.create_request(
+            POSTS_URL,
+            method="post",
+            headers={
+                "Content-Type": "application/json; charset=utf-8",
+            },
+            data={
+                "title": "Cat Pictures",
+            },
+        )
+        view = ApiView()
+        self.assertEqual(view.read_json(req), {"title": "Cat Pictures"})
+
+    def test_read_json_invalid_content_type(self):
+        req = self.factory.generic(
+            "POST",
+            POSTS_URL,
+            b'{"title": "Cat Pictures"}',
+            content_type="text/plain",
+        )
+        view = ApiView()
+
+        with self.assertRaises(ApiError) as err:
+            view.read_json(req)
+
+        self.assertEqual(str(err.exception), "Invalid Content-type provided.")
+
+        # Not checking the headers should still decode it.
+        self.assertEqual(view.read_json(req, strict=False), {"title": "Cat Pictures"})
+
+    def test_read_json_invalid_json(self):
+        req = self.factory.generic(
+            "POST",
+            POSTS_URL,
+            b'{"title": "Cat',
+            content_type="application/json",
+        )
+        view = ApiView()
+
+        with self.assertRaises(ApiError) as err:
+            view.read_json(req)
+
+        self.assertEqual(str(err.exception), "Invalid JSON payload provided.")
+
+    def test_serialize_many_queryset(self):
+        view = ApiView()
+        posts = BlogPost.objects.order_by("-published_on")
+        expected = [view.serializer.to_dict(post) for post in posts]
+
+        # Pulled straight from the database, in a single query.
+        with self.assertNumQueries(1):
+            data = view.serialize_many(BlogPost.objects.order_by("-published_on"))
+
+        self.assertEqual(data, expected)
+
+        # An already-evaluated `QuerySet` shouldn't be fetched again.
+        posts = BlogPost.objects.order_by("-published_on")
+        list(posts)
+
+        with self.assertNumQueries(0):
+            data = view.serialize_many(posts)
+
+        self.assertEqual(data, expected)
+
+    def test_serialize_many_list(self):
+        class CountingSerializer(ModelSerializer):
+            calls = 0
+
+            def to_dict_many(self, models, exclude=None):
+                CountingSerializer.calls += 1
+                return super().to_dict_many(models, exclude=exclude)
+
+        class CountingView(ApiView):
+            serializer = CountingSerializer()
+
+        view = CountingView()
+        data = view.serialize_many([self.post_2, self.post_1])
+        self.assertEqual(CountingSerializer.calls, 1)
+        self.assertEqual(
+            [post["slug"] for post in data],
+            ["life-update", "hello-world"],
+        )
+
+        # A customized `to_dict_many` is used for `QuerySet`s too.
+        data = view.serialize_many(BlogPost.objects.order_by("-published_on"))
+        self.assertEqual(CountingSerializer.calls, 2)
+        self.assertEqual(
+            [post["slug"] for post in data],
+            ["life-update", "hello-world"],
+        )
+
+    def test_serialize_many_custom_serialize(self):
+        class SlugView(ApiView):
+            def serialize(self, obj):
+                return {"slug": obj.slug}
+
+        view = SlugView()
+        data = view.serialize_many(BlogPost.objects.order_by("-published_on"))
+        self.assertEqual(data, [{"slug": "life-update"}, {"slug": "hello-world"}])
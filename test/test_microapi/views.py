@@ -1,3 +1,16 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import (
+    Count,
+    Max,
+)
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    quote_etag,
+)
+
 from microapi import ApiView
 from microapi import http
 
@@ -10,16 +23,52 @@ class OhHellNoError(Exception):
 
 class BlogPostListView(ApiView):
     bubble_exceptions = True
+    # Just the columns needed for listing (no potentially-large `content`).
+    # These are pulled straight from the database via `QuerySet.values`,
+    # without building any `BlogPost` instances. They're a subset of what
+    # `serialize` provides for a single post.
+    list_columns = (
+        "id",
+        "published_on",
+        "slug",
+        "title",
+    )
 
     def get(self, request):
-        posts = BlogPost.objects.all().order_by("-published_on")
-        return self.render(
-            {
-                "success": True,
-                "posts": self.serialize_many(posts),
-            }
+        # The list only changes when a post is added, updated or deleted. So
+        # clients that already have the current version can skip fetching,
+        # serializing & downloading it again.
+        stats = BlogPost.objects.aggregate(
+            last_updated=Max("updated_on"),
+            count=Count("id"),
+        )
+        etag = quote_etag(
+            hashlib.blake2b(
+                f"{stats['last_updated']}:{stats['count']}".encode(),
+                digest_size=8,
+            ).hexdigest()
         )
 
+        # Handles `If-None-Match` for us, returning a `304 Not Modified` (or
+        # `412 Precondition Failed`) if appropriate. There's deliberately no
+        # `Last-Modified`, as the latest `updated_on` can go backwards (or stay
+        # the same) when posts are deleted.
+        resp = get_conditional_response(request, etag=etag)
+
+        if resp is None:
+            posts = list(
+                BlogPost.objects.order_by("-published_on").values(*self.list_columns)
+            )
+            resp = self.render(
+                {
+                    "success": True,
+                    "posts": posts,
+                }
+            )
+
+        resp["ETag"] = etag
+        return resp
+
     def post(self, request):
         data = self.read_json(request)
         new_post = BlogPost()
@@ -45,26 +94,62 @@ class BlogPostListView(ApiView):
 
 class BlogPostDetailView(ApiView):
     # Not an HTTP method.
-    def get_blog_post(self, post_id):
-        return BlogPost.objects.get(pk=post_id)
+    def get_blog_post(self, post_id, full=True):
+        # Returns `None` (rather than raising) if there's no such post.
+        # If the (potentially large) `content` isn't needed, pass `full=False`
+        # to skip loading it.
+        posts = BlogPost.objects.filter(pk=post_id)
+
+        if not full:
+            posts = posts.defer("content")
+
+        return posts.first()
+
+    def not_found(self):
+        return self.render_error("Post does not exist", status_code=http.NOT_FOUND)
 
     def get(self, request, post_id):
-        try:
+        # Only look up when the post was last updated to start with, so cache
+        # hits don't need to load the (potentially large) `content`.
+        updated_on = (
+            BlogPost.objects.filter(pk=post_id)
+            .values_list("updated_on", flat=True)
+            .first()
+        )
+
+        if updated_on is None:
+            return self.not_found()
+
+        # Cache the already-encoded JSON. Because the key includes when the post
+        # was last updated, edits naturally skip past stale entries.
+        # Note that `QuerySet.update` doesn't touch `auto_now` fields, so
+        # changes made that way are served stale until the entry expires.
+        cache_key = f"post:{post_id}:{updated_on.timestamp()}"
+        body = cache.get(cache_key)
+
+        if body is None:
             post = self.get_blog_post(post_id)
-        except BlogPost.DoesNotExist:
-            return self.render_error("Post does not exist")
 
-        return self.render(
-            {
-                "success": True,
-                "post": self.serialize(post),
-            }
-        )
+            if post is None:
+                return self.not_found()
+
+            body = self.render(
+                {
+                    "success": True,
+                    "post": self.serialize(post),
+                }
+            ).content
+            cache.set(cache_key, body, 60 * 60)
+
+        return HttpResponse(body, content_type="application/json")
 
     def put(self, request, post_id):
         data = self.read_json(request)
         post = self.get_blog_post(post_id)
 
+        if post is None:
+            return self.not_found()
+
         self.serializer.from_dict(post, data, strict=True)
         post.save()
 
@@ -77,6 +162,10 @@ class BlogPostDetailView(ApiView):
         )
 
     def delete(self, request, post_id):
-        post = self.get_blog_post(post_id)
+        post = self.get_blog_post(post_id, full=False)
+
+        if post is None:
+            return self.not_found()
+
         post.delete()
         return self.render({}, status_code=http.NO_CONTENT)